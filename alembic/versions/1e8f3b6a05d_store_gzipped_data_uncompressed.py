@@ -0,0 +1,26 @@
+"""store gzipped data uncompressed
+
+Revision ID: 1e8f3b6a05d
+Revises: 4a9e0c2f7d1
+Create Date: 2026-10-14 11:20:52.647013
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '1e8f3b6a05d'
+down_revision = '4a9e0c2f7d1'
+
+from alembic import op
+
+
+def upgrade():
+    # only affects newly-written rows, existing data is left as-is
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in ['nzbs', 'nfos', 'sfvs']:
+            op.execute('ALTER TABLE {} ALTER COLUMN data SET STORAGE EXTERNAL'.format(table))
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in ['nzbs', 'nfos', 'sfvs']:
+            op.execute('ALTER TABLE {} ALTER COLUMN data SET STORAGE EXTENDED'.format(table))
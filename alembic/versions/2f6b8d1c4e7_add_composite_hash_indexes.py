@@ -0,0 +1,29 @@
+"""add composite hash indexes
+
+Revision ID: 2f6b8d1c4e7
+Revises: b82b375466
+Create Date: 2026-10-14 09:12:41.318204
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '2f6b8d1c4e7'
+down_revision = 'b82b375466'
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index('ix_binaries_hash_id', 'binaries', ['hash', 'id'], unique=False)
+    op.drop_index('ix_binaries_hash', table_name='binaries')
+
+    op.create_index('ix_parts_hash_group_name', 'parts', ['hash', 'group_name'], unique=False)
+    op.drop_index('ix_parts_hash', table_name='parts')
+
+
+def downgrade():
+    op.create_index('ix_parts_hash', 'parts', ['hash'], unique=False)
+    op.drop_index('ix_parts_hash_group_name', table_name='parts')
+
+    op.create_index('ix_binaries_hash', 'binaries', ['hash'], unique=False)
+    op.drop_index('ix_binaries_hash_id', table_name='binaries')
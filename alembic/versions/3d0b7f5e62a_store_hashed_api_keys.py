@@ -0,0 +1,45 @@
+"""store hashed api keys
+
+Revision ID: 3d0b7f5e62a
+Revises: 5c7d2e9a18b
+Create Date: 2026-10-14 13:07:15.952730
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3d0b7f5e62a'
+down_revision = '5c7d2e9a18b'
+
+from alembic import op
+import sqlalchemy as sa
+import hashlib
+
+
+users = sa.table('users',
+    sa.column('id', sa.Integer),
+    sa.column('api_key', sa.String),
+    sa.column('api_key_hash', sa.String)
+)
+
+
+def upgrade():
+    op.add_column('users', sa.Column('api_key_hash', sa.String(length=64), nullable=True))
+
+    conn = op.get_bind()
+    for id, api_key in conn.execute(sa.select([users.c.id, users.c.api_key])).fetchall():
+        if api_key:
+            conn.execute(users.update().where(users.c.id == id).values(
+                api_key_hash=hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+            ))
+
+    op.create_unique_constraint('users_api_key_hash_key', 'users', ['api_key_hash'])
+    op.drop_column('users', 'api_key')
+
+
+def downgrade():
+    # the original keys can't be recovered from their hashes
+    # users will need new keys generated
+    op.add_column('users', sa.Column('api_key', sa.String(length=32), nullable=True))
+    op.create_unique_constraint('users_api_key_key', 'users', ['api_key'])
+    op.drop_constraint('users_api_key_hash_key', 'users', type_='unique')
+    op.drop_column('users', 'api_key_hash')
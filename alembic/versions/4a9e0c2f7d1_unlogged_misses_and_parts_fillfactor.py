@@ -0,0 +1,25 @@
+"""unlogged misses and parts fillfactor
+
+Revision ID: 4a9e0c2f7d1
+Revises: d41a7e3b95c
+Create Date: 2026-10-14 10:41:09.120337
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '4a9e0c2f7d1'
+down_revision = 'd41a7e3b95c'
+
+from alembic import op
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE misses SET UNLOGGED')
+        op.execute('ALTER TABLE parts SET (fillfactor = 90)')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE parts RESET (fillfactor)')
+        op.execute('ALTER TABLE misses SET LOGGED')
@@ -0,0 +1,28 @@
+"""make unwanted index partial
+
+Revision ID: 5c7d2e9a18b
+Revises: 1e8f3b6a05d
+Create Date: 2026-10-14 11:58:36.402291
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '5c7d2e9a18b'
+down_revision = '1e8f3b6a05d'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    # partial indexes are postgres-only, everything else keeps the full one
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_releases_unwanted', table_name='releases')
+        op.create_index('ix_releases_unwanted', 'releases', ['unwanted'], unique=False,
+                        postgresql_where=sa.text('unwanted = true'))
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_releases_unwanted', table_name='releases')
+        op.create_index('ix_releases_unwanted', 'releases', ['unwanted'], unique=False)
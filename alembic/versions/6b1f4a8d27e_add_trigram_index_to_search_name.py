@@ -0,0 +1,25 @@
+"""add trigram index to search_name
+
+Revision ID: 6b1f4a8d27e
+Revises: 3d0b7f5e62a
+Create Date: 2026-10-14 13:44:50.271866
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '6b1f4a8d27e'
+down_revision = '3d0b7f5e62a'
+
+from alembic import op
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # needs to be run by a superuser on postgres < 13
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute('CREATE INDEX ix_releases_search_name_trgm ON releases USING gin (search_name gin_trgm_ops)')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX ix_releases_search_name_trgm')
@@ -0,0 +1,23 @@
+"""add composite misses index
+
+Revision ID: 8c3e5a1f09b
+Revises: 6b1f4a8d27e
+Create Date: 2026-10-14 13:41:07.552816
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '8c3e5a1f09b'
+down_revision = '6b1f4a8d27e'
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index('ix_misses_group_name_message', 'misses', ['group_name', 'message'], unique=False)
+    op.drop_index('ix_misses_group_name', table_name='misses')
+
+
+def downgrade():
+    op.create_index('ix_misses_group_name', 'misses', ['group_name'], unique=False)
+    op.drop_index('ix_misses_group_name_message', table_name='misses')
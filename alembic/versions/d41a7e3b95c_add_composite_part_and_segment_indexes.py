@@ -0,0 +1,34 @@
+"""add composite part and segment indexes
+
+Revision ID: d41a7e3b95c
+Revises: 2f6b8d1c4e7
+Create Date: 2026-10-14 10:03:27.884519
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'd41a7e3b95c'
+down_revision = '2f6b8d1c4e7'
+
+from alembic import op
+
+
+def upgrade():
+    # create the composites first, mysql won't drop an index a foreign key needs
+    op.create_index('ix_parts_group_name_posted', 'parts', ['group_name', 'posted'], unique=False)
+    op.create_index('ix_parts_binary_id_subject', 'parts', ['binary_id', 'subject'], unique=False)
+    op.create_index('ix_segments_part_id_segment', 'segments', ['part_id', 'segment'], unique=False)
+
+    op.drop_index('ix_parts_group_name', table_name='parts')
+    op.drop_index('ix_parts_binary_id', table_name='parts')
+    op.drop_index('ix_segments_part_id', table_name='segments')
+
+
+def downgrade():
+    op.create_index('ix_segments_part_id', 'segments', ['part_id'], unique=False)
+    op.create_index('ix_parts_binary_id', 'parts', ['binary_id'], unique=False)
+    op.create_index('ix_parts_group_name', 'parts', ['group_name'], unique=False)
+
+    op.drop_index('ix_segments_part_id_segment', table_name='segments')
+    op.drop_index('ix_parts_binary_id_subject', table_name='parts')
+    op.drop_index('ix_parts_group_name_posted', table_name='parts')
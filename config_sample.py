@@ -332,6 +332,29 @@ db = {
     'user': '',
     'pass': '',
     'db': 'pynab',
+
+    # connection pool settings
+    # these are per-process, so make sure that (pool_size + max_overflow)
+    # for every running pynab process fits under your server's max_connections
+
+    # pool_size: number of connections to keep open to the db
+    # should be at least as high as your update_threads
+    'pool_size': 20,
+
+    # max_overflow: extra connections allowed to open under load
+    # these are closed again once they're returned
+    'max_overflow': 10,
+
+    # pool_timeout: seconds to wait for a free connection before giving up
+    'pool_timeout': 30,
+
+    # pool_recycle: seconds before a connection is thrown away and reopened
+    # stops long-running processes hitting server-side connection timeouts
+    'pool_recycle': 3600,
+
+    # statement_timeout: postgres only, milliseconds before a query is cancelled
+    # 0 to disable. vacuums and release processing can take a while, so be generous
+    'statement_timeout': 0,
 }
 
 # usenet server details
@@ -99,6 +99,75 @@ class TestPynab(unittest.TestCase):
             q = search(q, 'engaged e06')
             print(q.first().search_name)
 
+    def test_binary_size_queries(self):
+        from sqlalchemy.orm import raiseload
+        from pynab.db import Binary, count_queries
+
+        with db_session() as db:
+            # raiseload: size() mustn't touch parts/segments at all
+            binary = db.query(Binary).options(raiseload('*')).first()
+            if not binary:
+                self.skipTest('no binaries to size')
+
+            with count_queries() as queries:
+                binary.size()
+            self.assertEqual(len(queries), 1)
+
+    def test_release_binary_queries(self):
+        from sqlalchemy.orm import raiseload
+        import pynab.nzbs
+        import pynab.releases
+        from pynab.db import count_queries
+
+        # process() has to call the module-level helper, not a local of the same name
+        self.assertNotIn('binary_query', pynab.releases.process.__code__.co_varnames)
+        self.assertIn('binary_query', pynab.releases.process.__code__.co_names)
+
+        with db_session() as db:
+            # raiseload: building the nzb has to work from what binary_query loaded
+            binary = pynab.releases.binary_query(db).options(raiseload('*')).first()
+            if not binary:
+                self.skipTest('no binaries to load')
+
+            with count_queries() as queries:
+                nzb = pynab.nzbs.create(binary.name, 'Test', binary)
+            self.assertTrue(nzb.data)
+            self.assertEqual(len(queries), 0)
+
+    def test_relationship_back_populates(self):
+        from pynab.db import Binary, Part, Segment
+
+        binary = Binary()
+        part = Part()
+        segment = Segment()
+
+        binary.parts.append(part)
+        segment.part = part
+
+        self.assertIs(part.binary, binary)
+        self.assertIn(segment, part.segments)
+
+    def test_keyset_paginate(self):
+        from pynab.db import Category, keyset_paginate
+
+        with db_session() as db:
+            expected = [id for id, in db.query(Category.id).order_by(Category.id).all()]
+            if not expected:
+                self.skipTest('no categories to page through')
+
+            # entity rows and column rows both have to give a cursor
+            for query in [db.query(Category), db.query(Category.id, Category.name)]:
+                seen = []
+                cursor = None
+                while True:
+                    rows, cursor = keyset_paginate(query, Category.id, after=cursor, size=3)
+                    if cursor is None:
+                        self.assertEqual(rows, [])
+                        break
+                    self.assertLessEqual(len(rows), 3)
+                    seen.extend(row.id for row in rows)
+                self.assertEqual(seen, expected)
+
     def test_nzb_parse(self):
         import pynab.nzbs
         from pynab.db import NZB
@@ -19,7 +19,7 @@ if __name__ == '__main__':
     sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
 
     import config
-    from pynab.db import Base, engine, Session, User, Group, Category, TvShow, Movie, DBID
+    from pynab.db import Base, engine, Session, User, Group, Category, TvShow, Movie, DBID, hash_api_key
     import pynab.util
     from scripts import nzedb_pre_import
 
@@ -40,6 +40,8 @@ if __name__ == '__main__':
     print('Installing admin user...')
     with open('db/initial/users.json', encoding='utf-8', errors='ignore') as f:
         data = json.load(f)
+        for user in data:
+            user['api_key_hash'] = hash_api_key(user.pop('api_key'))
         try:
             engine.execute(User.__table__.insert(), data)
         except Exception as e:
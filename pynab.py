@@ -94,9 +94,8 @@ def list_users():
     user_list = pynab.users.list()
     if user_list:
         for user in user_list:
-            print("Email: %s\tAPI Key: %s\tGrabs: %s" % (user[0],
-                                                         user[1],
-                                                         user[2]))
+            print("Email: %s\tGrabs: %s" % (user[0],
+                                           user[1]))
     else:
         print('No users found.')
 
@@ -104,7 +103,7 @@ def create_user(email):
     import pynab.users
 
     key = pynab.users.create(email)
-    print('user created. key: {}'.format(key))
+    print('user created. key: {} (keep it somewhere, it can\'t be shown again)'.format(key))
 
 
 def delete_user(email):
@@ -119,9 +118,8 @@ def info_user(email):
     import pynab.users
     user = pynab.users.info(email)
     if user:
-        print("Email: %s\tAPI Key: %s\tGrabs: %s" % (user[0],
-                                                     user[1],
-                                                     user[2]))
+        print("Email: %s\tGrabs: %s" % (user[0],
+                                       user[1]))
     else:
         print('User not found.')
 
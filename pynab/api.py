@@ -5,10 +5,11 @@ import gzip
 from mako.template import Template
 from mako import exceptions
 from bottle import request, response
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, defaultload
 from sqlalchemy import or_, func, desc
 
-from pynab.db import db_session, NZB, NFO, Release, User, Category, Group, Episode, Movie, DBID, TvShow, literalquery
+from pynab.db import db_session, NZB, NFO, Release, User, Category, Group, Episode, Movie, DBID, TvShow, literalquery, \
+    hash_api_key
 from pynab import log, root_dir
 import config
 import regex
@@ -51,7 +52,7 @@ def auth():
     api_key = request.query.apikey or ''
 
     with db_session() as db:
-        user = db.query(User).filter(User.api_key == api_key).first()
+        user = db.query(User).filter(User.api_key_hash == hash_api_key(api_key)).first()
         if user:
             return user
         else:
@@ -63,7 +64,8 @@ def get_nfo(dataset=None):
         id = request.query.guid or None
         if id:
             with db_session() as db:
-                release = db.query(Release).join(NFO).filter(Release.id == id).first()
+                release = db.query(Release).join(NFO).filter(Release.id == id) \
+                    .options(defaultload('nfo').undefer('data')).first()
                 if release:
                     data = release.nfo.data
                     response.set_header('Content-type', 'application/x-nfo')
@@ -91,7 +93,8 @@ def get_nzb(dataset=None):
 
         if id:
             with db_session() as db:
-                release = db.query(Release).join(NZB).join(Category).filter(Release.id == id).first()
+                release = db.query(Release).join(NZB).join(Category).filter(Release.id == id) \
+                    .options(defaultload('nzb').undefer('data')).first()
                 if release:
                     release.grabs += 1
                     user.grabs += 1
@@ -4,7 +4,7 @@ import pyhashxx
 import regex
 from sqlalchemy import *
 
-from pynab.db import db_session, Binary, Part, Regex, windowed_query
+from pynab.db import db_session, Binary, Part, Regex, windowed_query, insert_many
 from pynab import log
 import config
 
@@ -46,7 +46,7 @@ def save(db, binaries):
         if binary_inserts:
             # this could be optimised slightly with COPY but it's not really worth it
             # there's usually only a hundred or so rows
-            db.execute(Binary.__table__.insert(), binary_inserts)
+            insert_many(db, Binary, binary_inserts)
             db.commit()
 
         existing_binaries = dict(
@@ -112,9 +112,11 @@ def process():
                     db.commit()
 
             # noinspection PyComparisonWithNone
-            query = db.query(Part).filter(Part.group_name.in_(relevant_groups)).filter(Part.binary_id == None)
+            unprocessed = and_(Part.group_name.in_(relevant_groups), Part.binary_id == None)
+            query = db.query(Part).filter(unprocessed)
             total_parts = query.count()
-            for part in windowed_query(query, Part.id, config.scan.get('binary_process_chunk_size', 1000)):
+            for part in windowed_query(query, Part.id, config.scan.get('binary_process_chunk_size', 1000),
+                                       where=unprocessed):
                 found = False
                 total_processed += 1
                 count += 1
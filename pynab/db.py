@@ -8,10 +8,12 @@ import os
 import hashlib
 
 import psycopg2
+import psycopg2.extras
 from sqlalchemy import Column, Integer, BigInteger, LargeBinary, Text, String, Boolean, DateTime, ForeignKey, \
-    create_engine, UniqueConstraint, Enum, Index, func, and_, exc, event
+    create_engine, UniqueConstraint, Enum, Index, DDL, func, and_, bindparam, exc, event
+from sqlalchemy.ext import baked
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, backref, sessionmaker, scoped_session
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session, object_session, deferred
 from sqlalchemy.pool import Pool
 
 import config
@@ -91,6 +93,36 @@ def copy_file(engine, data, ordering, type):
 
     return True
 
+def insert_many(db, type, rows, page_size=1000):
+    """
+    Insert a batch of rows (dicts) into type's table, within the session's transaction.
+
+    Postgres gets multi-row INSERT ... VALUES statements, page_size rows
+    at a time. executemany() on psycopg2 is one round-trip per row.
+    Keys that aren't columns are ignored. Python-side column defaults
+    aren't applied, so supply any values you need.
+
+    Everything else goes through executemany(), which the mysql drivers
+    already batch into multi-row inserts.
+    """
+    if not rows:
+        return
+
+    if 'postgre' in config.db.get('engine'):
+        columns = [c.name for c in type.__table__.columns if c.name in rows[0]]
+        cur = db.connection().connection.cursor()
+        try:
+            psycopg2.extras.execute_values(
+                cur,
+                'INSERT INTO {} ({}) VALUES %s'.format(type.__tablename__, ', '.join(columns)),
+                [tuple(row.get(c) for c in columns) for row in rows],
+                page_size=page_size
+            )
+        finally:
+            cur.close()
+    else:
+        db.execute(type.__table__.insert(), rows)
+
 def truncate_table(engine, table_type):
     """
     Handles truncate table for given table type.
@@ -159,9 +191,19 @@ def vacuum(mode='scan', full=False):
 connect_args = {}
 if 'mysql' in config.db.get('engine'):
     connect_args = {'charset': 'utf8', 'local_infile': 1}
+elif 'postgre' in config.db.get('engine') and config.db.get('statement_timeout'):
+    connect_args = {'options': '-c statement_timeout={:d}'.format(config.db.get('statement_timeout'))}
 
 Base = declarative_base()
-engine = create_engine(sqlalchemy_url(), pool_recycle=3600, connect_args=connect_args)
+bakery = baked.bakery()
+engine = create_engine(
+    sqlalchemy_url(),
+    pool_size=config.db.get('pool_size', 20),
+    max_overflow=config.db.get('max_overflow', 10),
+    pool_timeout=config.db.get('pool_timeout', 30),
+    pool_recycle=config.db.get('pool_recycle', 3600),
+    connect_args=connect_args
+)
 Session = scoped_session(sessionmaker(bind=engine))
 
 # enable query debugging
@@ -245,7 +287,8 @@ def literalquery(statement):
         compile_kwargs={'literal_binds': True},
     ).string
 
-# handle mysql disconnections
+# handle stale connections (server restarts, mysql timeouts, etc)
+# equivalent of pool_pre_ping, which needs sqlalchemy 1.2
 @event.listens_for(Pool, "checkout")
 def ping_connection(dbapi_connection, connection_record, connection_proxy):
     cursor = dbapi_connection.cursor()
@@ -274,20 +317,44 @@ def db_session():
         raise
 
 
+@contextmanager
+def count_queries():
+    """Record every statement sent to the db inside the block.
+
+    Handy for making sure a code path doesn't issue more
+    queries than it should (lazy loads and the like)."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
 # thanks zzzeek! https://bitbucket.org/zzzeek/sqlalchemy/wiki/UsageRecipes/WindowedRangeQuery
-def column_windows(session, column, windowsize):
+def column_windows(session, column, windowsize, where=None):
     """Return a series of WHERE clauses against
     a given column that break it into windows.
 
-    Result is an iterable of tuples, consisting of
-    ((start, end), whereclause), where (start, end) are the ids.
-
-    Requires a database that supports window functions,
-    i.e. Postgresql, SQL Server, Oracle.
-
-    Enhance this yourself !  Add a "where" argument
-    so that windows of just a subset of rows can
-    be computed.
+    Result is an iterable of WHERE clauses covering
+    [start, end) ranges of the column, the last of
+    which is open-ended.
+
+    Window boundaries are found by walking the index
+    on the column: each boundary is a single
+    ORDER BY/OFFSET/LIMIT 1 probe past the previous one,
+    so only one row per window is ever read to build
+    them, rather than numbering the whole table.
+
+    If where is given, windows are computed over just
+    the rows that match it, so each window holds
+    windowsize matching rows rather than windowsize
+    rows of the whole table. It can only reference
+    the column's own table.
     """
 
     def int_for_range(start_id, end_id):
@@ -299,34 +366,49 @@ def column_windows(session, column, windowsize):
         else:
             return column >= start_id
 
-    q = session.query(
-        column,
-        func.row_number().
-        over(order_by=column).
-        label('rownum')
-    ). \
-        from_self(column)
-    if windowsize > 1:
-        q = q.filter("rownum %% %d=1" % windowsize)
-
-    intervals = [id for id, in q]
-
-    while intervals:
-        start = intervals.pop(0)
-        if intervals:
-            end = intervals[0]
-        else:
-            end = None
+    # the boundary probes are baked, so they're only compiled once
+    # rather than on every window
+    q = bakery(lambda session: session.query(column), column)
+    q += lambda q: q.order_by(column)
+    if where is not None:
+        q.add_criteria(lambda q: q.filter(where), where)
+
+    first = q.with_criteria(lambda q: q.limit(1))
+    following = q.with_criteria(
+        lambda q: q.filter(column > bindparam('start')).offset(max(windowsize - 1, 0)).limit(1),
+        windowsize
+    )
+
+    row = first(session).first()
+    start = row[0] if row else None
+    while start is not None:
+        row = following(session).params(start=start).first()
+        end = row[0] if row else None
         yield int_for_range(start, end)
+        start = end
 
 
-def windowed_query(qry, pk, size):
+def windowed_query(qry, pk, size, stream=False, where=None):
     """
     Break a Query into windows on a given column.
+
+    where is passed to column_windows - if the query's
+    filters only touch pk's table, pass them here too
+    so the windows are built over matching rows only.
+
+    If stream is set (postgres only), don't bother with windows:
+    read the whole query through one server-side cursor, size rows
+    at a time. Only do this if nothing commits while the results
+    are being iterated, since a commit closes the cursor.
     """
 
     if 'postgre' in config.db.get('engine'):
-        for whereclause in column_windows(qry.session, pk, size):
+        if stream:
+            for row in qry.order_by(pk).yield_per(size):
+                yield row
+            return
+
+        for whereclause in column_windows(qry.session, pk, size, where):
             for row in qry.filter(whereclause).order_by(pk):
                 yield row
     else:
@@ -344,6 +426,25 @@ def windowed_query(qry, pk, size):
             firstid = pk.__get__(rec, pk) if rec else None
 
 
+def keyset_paginate(qry, key_col, after=None, size=100):
+    """
+    Fetch one page of a Query, ordered on a unique column.
+
+    Instead of an OFFSET (which has to walk every skipped row),
+    filter on key_col > after. Returns (rows, next_cursor), where
+    next_cursor is the last key on the page - pass it back as after
+    to get the next one. It's None once there's nothing left.
+    """
+
+    if after is not None:
+        qry = qry.filter(key_col > after)
+
+    rows = qry.order_by(key_col).limit(size).all()
+    next_cursor = getattr(rows[-1], key_col.key) if rows else None
+
+    return rows, next_cursor
+
+
 def json_serial(obj):
     if isinstance(obj, datetime.datetime):
         serial = obj.isoformat()
@@ -363,13 +464,17 @@ def create_hash(context):
         context.current_parameters['posted']
     ).encode('utf-8')).hexdigest()
 
+def hash_api_key(api_key):
+    """API keys are only stored hashed, this turns a key into its stored form."""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
 class Release(Base):
     __tablename__ = 'releases'
 
     id = Column(Integer, primary_key=True)
     uniqhash = Column(String(40), default=create_hash, unique=True)
 
-    added = Column(DateTime, default=func.now())
+    added = Column(DateTime, default=datetime.datetime.utcnow)
     posted = Column(DateTime)
 
     name = Column(String(512))
@@ -382,51 +487,54 @@ class Release(Base):
     size = Column(BigInteger, default=0)
 
     passworded = Column(Enum('UNKNOWN', 'YES', 'NO', 'MAYBE', name='enum_passworded'), default='UNKNOWN')
-    unwanted = Column(Boolean, default=False, index=True)
+    unwanted = Column(Boolean, default=False)
 
     group_id = Column(Integer, ForeignKey('groups.id'), index=True)
-    group = relationship('Group', backref=backref('releases'))
+    group = relationship('Group', back_populates='releases')
 
     category_id = Column(Integer, ForeignKey('categories.id'), index=True)
-    category = relationship('Category', backref=backref('releases'))
+    category = relationship('Category', back_populates='releases')
 
     regex_id = Column(Integer, ForeignKey('regexes.id', ondelete='SET NULL'), index=True)
-    regex = relationship('Regex', backref=backref('releases'))
+    regex = relationship('Regex', back_populates='releases')
 
     tvshow_id = Column(Integer, ForeignKey('tvshows.id'), index=True)
-    tvshow = relationship('TvShow', backref=backref('releases'))
+    tvshow = relationship('TvShow', back_populates='releases')
     tvshow_metablack_id = Column(Integer, ForeignKey('metablack.id', ondelete='SET NULL'), index=True)
     tvshow_metablack = relationship('MetaBlack', foreign_keys=[tvshow_metablack_id])
 
     movie_id = Column(Integer, ForeignKey('movies.id'), index=True)
-    movie = relationship('Movie', backref=backref('releases'))
+    movie = relationship('Movie', back_populates='releases')
     movie_metablack_id = Column(Integer, ForeignKey('metablack.id', ondelete='SET NULL'), index=True)
     movie_metablack = relationship('MetaBlack', foreign_keys=[movie_metablack_id])
 
     nzb_id = Column(Integer, ForeignKey('nzbs.id', ondelete='CASCADE'), index=True)
-    nzb = relationship('NZB', backref=backref('release', uselist=False))
+    nzb = relationship('NZB', back_populates='release')
 
-    files = relationship('File', passive_deletes=True, cascade='all, delete, delete-orphan', backref=backref('release'))
+    files = relationship('File', passive_deletes=True, cascade='all, delete, delete-orphan', back_populates='release')
     rar_metablack_id = Column(Integer, ForeignKey('metablack.id', ondelete='SET NULL'), index=True)
     rar_metablack = relationship('MetaBlack', foreign_keys=[rar_metablack_id])
 
     nfo_id = Column(Integer, ForeignKey('nfos.id', ondelete='CASCADE'), index=True)
-    nfo = relationship('NFO', backref=backref('release', uselist=False))
+    nfo = relationship('NFO', back_populates='release')
     nfo_metablack_id = Column(Integer, ForeignKey('metablack.id', ondelete='SET NULL'), index=True)
     nfo_metablack = relationship('MetaBlack', foreign_keys=[nfo_metablack_id])
 
     sfv_id = Column(Integer, ForeignKey('sfvs.id', ondelete='CASCADE'), index=True)
-    sfv = relationship('SFV', backref=backref('release', uselist=False))
+    sfv = relationship('SFV', back_populates='release')
     sfv_metablack_id = Column(Integer, ForeignKey('metablack.id', ondelete='SET NULL'), index=True)
     sfv_metablack = relationship('MetaBlack', foreign_keys=[sfv_metablack_id])
 
     episode_id = Column(Integer, ForeignKey('episodes.id'), index=True)
-    episode = relationship('Episode', backref=backref('releases'))
+    episode = relationship('Episode', back_populates='releases')
 
     pre_id = Column(Integer, ForeignKey('pres.id'), index=True)
-    pre = relationship('Pre', backref=backref('pre'))
+    pre = relationship('Pre', back_populates='pre')
 
     __table_args__ = (
+        # almost nothing is unwanted at any one time, and it's only ever
+        # queried for unwanted == True, so postgres only indexes those
+        Index('ix_releases_unwanted', unwanted, postgresql_where=(unwanted == True)),
         {
             'mysql_engine': 'InnoDB',
             'mysql_charset': 'utf8',
@@ -434,6 +542,14 @@ class Release(Base):
         }
     )
 
+# api searches are unanchored ILIKEs on search_name, which the btree index
+# can't help with. on postgres, a trigram index can
+event.listen(Release.__table__, 'before_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+event.listen(Release.__table__, 'after_create',
+             DDL('CREATE INDEX ix_releases_search_name_trgm ON releases '
+                 'USING gin (search_name gin_trgm_ops)').execute_if(dialect='postgresql'))
+
 
 class MetaBlack(Base):
     __tablename__ = 'metablack'
@@ -441,7 +557,7 @@ class MetaBlack(Base):
     id = Column(Integer, primary_key=True)
 
     status = Column(Enum('ATTEMPTED', 'IMPOSSIBLE', name='enum_metablack_status'), default='ATTEMPTED')
-    time = Column(DateTime, default=func.now())
+    time = Column(DateTime, default=datetime.datetime.utcnow)
 
     tvshow = relationship('Release', cascade='all, delete, delete-orphan', uselist=False,
                           foreign_keys=[Release.tvshow_metablack_id])
@@ -469,7 +585,7 @@ class Episode(Base):
     id = Column(Integer, primary_key=True)
 
     tvshow_id = Column(Integer, ForeignKey('tvshows.id'), index=True)
-    tvshow = relationship('TvShow', backref=backref('episodes'))
+    tvshow = relationship('TvShow', back_populates='episodes')
 
     season = Column(String(10))
     episode = Column(String(20))
@@ -477,6 +593,8 @@ class Episode(Base):
     air_date = Column(String(16))
     year = Column(String(8))
 
+    releases = relationship('Release', back_populates='episode')
+
     __table_args__ = (
         UniqueConstraint(tvshow_id, series_full),
         {
@@ -496,6 +614,7 @@ class File(Base):
     size = Column(BigInteger)
 
     release_id = Column(Integer, ForeignKey('releases.id', ondelete='CASCADE'), index=True)
+    release = relationship('Release', back_populates='files')
 
     __table_args__ = (
         {
@@ -516,6 +635,8 @@ class Group(Base):
     last = Column(BigInteger)
     name = Column(String(200))
 
+    releases = relationship('Release', back_populates='group')
+
     __table_args__ = (
         {
             'mysql_engine': 'InnoDB',
@@ -529,7 +650,7 @@ class Binary(Base):
     __tablename__ = 'binaries'
 
     id = Column(Integer, primary_key=True)
-    hash = Column(BigInteger, index=True)
+    hash = Column(BigInteger)
 
     name = Column(String(512), index=True)
     total_parts = Column(Integer)
@@ -541,19 +662,33 @@ class Binary(Base):
     group_name = Column(String(200))
 
     regex_id = Column(Integer, ForeignKey('regexes.id', ondelete='SET NULL'), index=True)
-    regex = relationship('Regex', backref=backref('binaries'))
+    regex = relationship('Regex', back_populates='binaries')
 
-    parts = relationship('Part', passive_deletes=True, order_by="asc(Part.subject)")
+    parts = relationship('Part', passive_deletes=True, back_populates='binary')
 
     def size(self):
-        size = 0
-        for part in self.parts:
-            for segment in part.segments:
-                size += segment.size
+        """Total size of the binary's segments, summed in the db
+        so that parts/segments don't need to be loaded."""
+        return Binary.sizes_for(object_session(self), [self.id]).get(self.id, 0)
 
-        return size
+    @classmethod
+    def sizes_for(cls, session, binary_ids):
+        """Sizes of a batch of binaries in a single query, as {binary_id: size}.
+        Binaries without any segments are left out."""
+        if not binary_ids:
+            return {}
+
+        sizes = session.query(Part.binary_id, func.sum(Segment.size)) \
+            .join(Segment, Segment.part_id == Part.id) \
+            .filter(Part.binary_id.in_(binary_ids)) \
+            .group_by(Part.binary_id)
+
+        return {binary_id: int(size) for binary_id, size in sizes}
 
     __table_args__ = (
+        # binaries are only ever looked up by hash to get their id
+        # so include it in the index and skip the table entirely
+        Index('ix_binaries_hash_id', 'hash', 'id'),
         {
             'mysql_engine': 'InnoDB',
             'mysql_charset': 'utf8',
@@ -567,7 +702,7 @@ class Part(Base):
     __tablename__ = 'parts'
 
     id = Column(BigInteger, primary_key=True)
-    hash = Column(BigInteger, index=True)
+    hash = Column(BigInteger)
 
     subject = Column(String(512))
     total_segments = Column(Integer, index=True)
@@ -576,13 +711,19 @@ class Part(Base):
     posted_by = Column(String(200))
 
     xref = Column(String(1024))
-    group_name = Column(String(200), index=True)
+    group_name = Column(String(200))
 
-    binary_id = Column(Integer, ForeignKey('binaries.id', ondelete='CASCADE'), index=True)
+    binary_id = Column(Integer, ForeignKey('binaries.id', ondelete='CASCADE'))
+    binary = relationship('Binary', back_populates='parts')
 
-    segments = relationship('Segment', passive_deletes=True, order_by="asc(Segment.segment)")
+    segments = relationship('Segment', passive_deletes=True, back_populates='part')
 
     __table_args__ = (
+        # parts are looked up by hash within a group during save
+        Index('ix_parts_hash_group_name', 'hash', 'group_name'),
+        # these cover the group_name and binary_id indexes too
+        Index('ix_parts_group_name_posted', 'group_name', 'posted'),
+        Index('ix_parts_binary_id_subject', 'binary_id', 'subject'),
         {
             'mysql_engine': 'InnoDB',
             'mysql_charset': 'utf8',
@@ -590,6 +731,11 @@ class Part(Base):
         }
     )
 
+# parts get their binary_id set shortly after they're saved, so
+# leave some room on each page for the updated rows
+event.listen(Part.__table__, 'after_create',
+             DDL('ALTER TABLE parts SET (fillfactor = 90)').execute_if(dialect='postgresql'))
+
 
 # likewise
 class Segment(Base):
@@ -601,9 +747,12 @@ class Segment(Base):
     size = Column(Integer)
     message_id = Column(String(256))
 
-    part_id = Column(BigInteger, ForeignKey('parts.id', ondelete='CASCADE'), index=True)
+    part_id = Column(BigInteger, ForeignKey('parts.id', ondelete='CASCADE'))
+    part = relationship('Part', back_populates='segments')
 
     __table_args__ = (
+        # also covers part_id, and returns a part's segments in order
+        Index('ix_segments_part_id_segment', 'part_id', 'segment'),
         {
             'mysql_engine': 'InnoDB',
             'mysql_charset': 'utf8',
@@ -616,13 +765,16 @@ class Miss(Base):
     __tablename__ = 'misses'
 
     id = Column(Integer, primary_key=True)
-    group_name = Column(String(200), index=True)
+    group_name = Column(String(200))
 
     message = Column(BigInteger, index=True, nullable=False)
 
     attempts = Column(Integer)
 
     __table_args__ = (
+        # misses are always read by group and message range, and the
+        # per-group listing in scan can be answered from the index alone
+        Index('ix_misses_group_name_message', 'group_name', 'message'),
         {
             'mysql_engine': 'InnoDB',
             'mysql_charset': 'utf8',
@@ -630,6 +782,11 @@ class Miss(Base):
         }
     )
 
+# misses are high-churn and losing them in a crash just means
+# they don't get retried, so don't bother writing them to the WAL
+event.listen(Miss.__table__, 'after_create',
+             DDL('ALTER TABLE misses SET UNLOGGED').execute_if(dialect='postgresql'))
+
 
 class Regex(Base):
     __tablename__ = 'regexes'
@@ -645,6 +802,9 @@ class Regex(Base):
     # sometimes regex
     group_name = Column(String(200))
 
+    releases = relationship('Release', back_populates='regex')
+    binaries = relationship('Binary', back_populates='regex')
+
     __table_args__ = (
         {
             'mysql_engine': 'InnoDB',
@@ -683,6 +843,7 @@ class Category(Base):
     parent_id = Column(Integer, ForeignKey('categories.id'), index=True)
     parent = relationship('Category', remote_side=[id])
     children = relationship('Category')
+    releases = relationship('Release', back_populates='category')
 
     __table_args__ = (
         {
@@ -698,7 +859,8 @@ class User(Base):
 
     id = Column(Integer, primary_key=True)
 
-    api_key = Column(String(32), unique=True)
+    # sha256 of the key, see hash_api_key()
+    api_key_hash = Column(String(64), unique=True)
     email = Column(String(256), unique=True)
     grabs = Column(Integer)
 
@@ -711,11 +873,15 @@ class User(Base):
     )
 
 
+# nzb/nfo/sfv data is deferred, so it's only fetched when it's used
+# anything that's going to read it should undefer it in the same query
 class NZB(Base):
     __tablename__ = 'nzbs'
 
     id = Column(Integer, primary_key=True)
-    data = Column(LargeBinary((2**32)-1))
+    data = deferred(Column(LargeBinary((2**32)-1)))
+
+    release = relationship('Release', back_populates='nzb', uselist=False)
 
     __table_args__ = (
         {
@@ -730,7 +896,9 @@ class NFO(Base):
     __tablename__ = 'nfos'
 
     id = Column(Integer, primary_key=True)
-    data = Column(LargeBinary)
+    data = deferred(Column(LargeBinary))
+
+    release = relationship('Release', back_populates='nfo', uselist=False)
 
     __table_args__ = (
         {
@@ -745,7 +913,9 @@ class SFV(Base):
     __tablename__ = 'sfvs'
 
     id = Column(Integer, primary_key=True)
-    data = Column(LargeBinary)
+    data = deferred(Column(LargeBinary))
+
+    release = relationship('Release', back_populates='sfv', uselist=False)
 
     __table_args__ = (
         {
@@ -755,13 +925,19 @@ class SFV(Base):
         }
     )
 
+# nzbs, nfos and sfvs are gzipped before they're saved, so don't
+# let postgres waste time trying to compress them again when toasting
+for table in (NZB.__table__, NFO.__table__, SFV.__table__):
+    event.listen(table, 'after_create',
+                 DDL('ALTER TABLE %(table)s ALTER COLUMN data SET STORAGE EXTERNAL').execute_if(dialect='postgresql'))
+
 
 class DataLog(Base):
     __tablename__ = 'datalogs'
 
     id = Column(Integer, primary_key=True)
     description = Column(String(256), index=True)
-    data = Column(Text)
+    data = deferred(Column(Text))
 
     __table_args__ = (
         {
@@ -787,6 +963,8 @@ class Pre(Base):
     filename = Column(String(512))
     nuked = Column(Boolean, default=False)
 
+    pre = relationship('Release', back_populates='pre')
+
     __table_args__ = (
         UniqueConstraint(requestid, pretime, requestgroup),
         {
@@ -807,10 +985,10 @@ class DBID(Base):
     db_id = Column(String(50))
     db = Column(Enum('TVRAGE', 'TVMAZE', 'OMDB', name='enum_dbid_name'))
 
-    tvshow = relationship('TvShow', backref='ids')
+    tvshow = relationship('TvShow', back_populates='ids')
     tvshow_id = Column(Integer, ForeignKey('tvshows.id'), index=True)
 
-    movie = relationship('Movie', backref='ids')
+    movie = relationship('Movie', back_populates='ids')
     movie_id = Column(Integer, ForeignKey('movies.id'), index=True)
 
     __table_args__ = (
@@ -833,6 +1011,9 @@ class Movie(Base):
     genre = Column(String(256))
     year = Column(Integer, index=True)
 
+    releases = relationship('Release', back_populates='movie')
+    ids = relationship('DBID', back_populates='movie')
+
     __table_args__ = (
         {
             'mysql_engine': 'InnoDB',
@@ -849,6 +1030,10 @@ class TvShow(Base):
     name = Column(String(256), index=True)
     country = Column(String(5))
 
+    releases = relationship('Release', back_populates='tvshow')
+    episodes = relationship('Episode', back_populates='tvshow')
+    ids = relationship('DBID', back_populates='tvshow')
+
     __table_args__ = (
         {
             'mysql_engine': 'InnoDB',
@@ -3,7 +3,7 @@ from sqlalchemy.sql.expression import bindparam
 #from memory_profiler import profile
 
 from pynab import log
-from pynab.db import db_session, Group, Miss
+from pynab.db import db_session, Group, Miss, insert_many
 from pynab.server import Server
 import pynab.parts
 import config
@@ -161,7 +161,7 @@ def save_missing_segments(group_name, missing_segments):
 
         # batch-insert the missing messages
         if new_misses:
-            db.execute(Miss.__table__.insert(), [
+            insert_many(db, Miss, [
                 {
                     'message': m,
                     'group_name': group_name,
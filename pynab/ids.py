@@ -2,7 +2,6 @@ import unicodedata
 import regex
 import roman
 import datetime
-import pytz
 import time
 
 from pynab import log
@@ -27,7 +26,8 @@ def process(type, interfaces=None, limit=None, online=True):
     :param online: whether to check online apis
     :return:
     """
-    expiry = datetime.datetime.now(pytz.utc) - datetime.timedelta(config.postprocess.get('fetch_blacklist_duration', 7))
+    # metablack times are stored as naive utc
+    expiry = datetime.datetime.utcnow() - datetime.timedelta(config.postprocess.get('fetch_blacklist_duration', 7))
 
     with db_session() as db:
         # noinspection PyComparisonWithNone,PyComparisonWithNone
@@ -1,6 +1,7 @@
 import gzip
 
 import regex
+from sqlalchemy.orm import defaultload
 
 import pynab.nzbs
 import pynab.util
@@ -39,7 +40,7 @@ def process(limit=None, category=0):
         with db_session() as db:
             # noinspection PyComparisonWithNone,PyComparisonWithNone
             query = db.query(Release).join(Group).join(NZB).filter(Release.nfo == None).filter(
-                Release.nfo_metablack_id == None)
+                Release.nfo_metablack_id == None).options(defaultload('nzb').undefer('data'))
             if category:
                 query = query.filter(Release.category_id == int(category))
 
@@ -134,7 +134,8 @@ def create(name, parent_category_name, binary):
                                                                                                  escape(name))
     )
 
-    for part in binary.parts:
+    # parts and segments come back unordered, nzbs need them sorted
+    for part in sorted(binary.parts, key=lambda p: p.subject):
         timestamp = calendar.timegm(part.posted.replace(tzinfo=pytz.utc).utctimetuple())
 
         xml.write('<file poster={} date="{}" subject={}>\n<groups>'.format(
@@ -147,7 +148,7 @@ def create(name, parent_category_name, binary):
             xml.write('<group>{}</group>\n'.format(group))
 
         xml.write('</groups>\n<segments>\n')
-        for segment in part.segments:
+        for segment in sorted(part.segments, key=lambda s: s.segment):
             xml.write('<segment bytes="{}" number="{}">{}</segment>\n'.format(
                 segment.size,
                 segment.segment,
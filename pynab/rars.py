@@ -4,6 +4,7 @@ import shutil
 import subprocess
 
 import regex
+from sqlalchemy.orm import defaultload
 
 import lib.rar
 from pynab import log
@@ -244,7 +245,8 @@ def process(limit=None, category=0):
         with db_session() as db:
             # noinspection PyComparisonWithNone
             query = db.query(Release).join(Group).join(NZB).filter(~Release.files.any()). \
-                filter(Release.passworded == 'UNKNOWN').filter(Release.rar_metablack_id == None)
+                filter(Release.passworded == 'UNKNOWN').filter(Release.rar_metablack_id == None). \
+                options(defaultload('nzb').undefer('data'))
             if category:
                 query = query.filter(Release.category_id == int(category))
 
@@ -133,6 +133,27 @@ def clean_release_name(name):
     return name.replace('_', ' ').replace('.', ' ').replace('-', ' ')
 
 
+def binary_query(db, oversized=False):
+    """Query for loading a binary with everything needed
+    to create its release and nzb."""
+    if oversized:
+        # for giant binaries, we do it differently
+        # lazyload the segments in parts and expunge when done
+        # this way we only have to store binary+parts
+        # and one section of segments at one time
+        return db.query(Binary).options(
+            subqueryload('parts'),
+            lazyload('parts.segments'),
+        )
+    else:
+        # otherwise, start loading all the binary details
+        return db.query(Binary).options(
+            subqueryload('parts'),
+            subqueryload('parts.segments'),
+            Load(Part).load_only(Part.id, Part.subject),
+        )
+
+
 def process():
     """Helper function to begin processing binaries. Checks
     for 100% completion and will create NZBs/releases for
@@ -152,7 +173,7 @@ def process():
     start = time.time()
 
     with db_session() as db:
-        binary_query = """
+        completed_query = """
             SELECT
                 binaries.id, binaries.name, binaries.posted, binaries.total_parts
             FROM binaries
@@ -183,7 +204,12 @@ def process():
         # 38,000 releases uses 8.9mb of memory here
         # no real need to batch it, since this will mostly be run with
         # < 1000 releases per run
-        for completed_binary in engine.execute(binary_query).fetchall():
+        completed_binaries = engine.execute(completed_query).fetchall()
+
+        # sum up every binary's segments at once, rather than a query per binary
+        binary_sizes = Binary.sizes_for(db, [completed_binary[0] for completed_binary in completed_binaries])
+
+        for completed_binary in completed_binaries:
             # some optimisations here. we used to take the binary id and load it
             # then compare binary.name and .posted to any releases
             # in doing so, we loaded the binary into the session
@@ -212,10 +238,12 @@ def process():
                 # we only care if it's a really big file
                 # abs in case it's a 1 part release (abs(1 - 2) = 1)
                 # int(/2) works fine (int(1/2) = 0, array is 0-indexed)
+                # relationships aren't ordered, so sort them here
                 try:
+                    middle_part = sorted(binary.parts, key=lambda p: p.subject)[int(binary.total_parts / 2)]
                     est_size = (abs(binary.total_parts - 2) *
-                                binary.parts[int(binary.total_parts / 2)].total_segments *
-                                binary.parts[int(binary.total_parts / 2)].segments[0].size)
+                                middle_part.total_segments *
+                                sorted(middle_part.segments, key=lambda s: s.segment)[0].size)
                 except IndexError:
                     log.error('release: binary [{}] - couldn\'t estimate size - bad regex: {}?'.format(binary.id, binary.regex_id))
                     continue
@@ -228,22 +256,7 @@ def process():
                     db.commit()
                     continue
 
-                if oversized:
-                    # for giant binaries, we do it differently
-                    # lazyload the segments in parts and expunge when done
-                    # this way we only have to store binary+parts
-                    # and one section of segments at one time
-                    binary = db.query(Binary).options(
-                        subqueryload('parts'),
-                        lazyload('parts.segments'),
-                    ).filter(Binary.id == completed_binary[0]).first()
-                else:
-                    # otherwise, start loading all the binary details
-                    binary = db.query(Binary).options(
-                        subqueryload('parts'),
-                        subqueryload('parts.segments'),
-                        Load(Part).load_only(Part.id, Part.subject, Part.segments),
-                    ).filter(Binary.id == completed_binary[0]).first()
+                binary = binary_query(db, oversized).filter(Binary.id == completed_binary[0]).first()
 
                 blacklisted = False
                 for blacklist in blacklists:
@@ -275,7 +288,7 @@ def process():
                 if oversized:
                     release.size = est_size
                 else:
-                    release.size = binary.size()
+                    release.size = binary_sizes.get(binary.id, 0)
 
                 # check against minimum size for this group
                 undersized = False
@@ -27,7 +27,8 @@ def process(limit=None):
             query = db.query(Release).join(Group).filter(Group.name==group).filter(Release.pre_id == None).\
                 filter(Release.category_id == '8010').filter("releases.name ~ '{}'".format(reg))
 
-            for release in windowed_query(query, Release.id, config.scan.get('binary_process_chunk_size')):
+            # nothing's committed until every request is collected, so it's safe to stream
+            for release in windowed_query(query, Release.id, config.scan.get('binary_process_chunk_size'), stream=True):
                 # check if it's aliased
                 if release.group.name in GROUP_ALIASES:
                     group_name = GROUP_ALIASES[release.group.name]
@@ -1,7 +1,7 @@
 import hashlib
 import uuid
 
-from pynab.db import db_session, User
+from pynab.db import db_session, User, hash_api_key
 
 def list():
     """List all users."""
@@ -9,7 +9,7 @@ def list():
         users = db.query(User).order_by(User.email)
         user_list = []
         for user in users:
-            user_list.append([user.email, user.api_key, user.grabs])
+            user_list.append([user.email, user.grabs])
 
         return user_list
 
@@ -18,18 +18,20 @@ def info(email):
     with db_session() as db:
         user = db.query(User).filter(User.email == email).first()
         if user:
-            return [user.email, user.api_key, user.grabs]
+            return [user.email, user.grabs]
         else:
             return None
 
 def create(email):
-    """Creates a user by email with a random API key."""
+    """Creates a user by email with a random API key.
+    Only a hash of the key is stored, so this is the only
+    time it's available."""
     api_key = hashlib.md5(uuid.uuid4().bytes).hexdigest()
 
     with db_session() as db:
         user = User()
         user.email = email
-        user.api_key = api_key
+        user.api_key_hash = hash_api_key(api_key)
         user.grabs = 0
 
         db.merge(user)
@@ -14,7 +14,7 @@ import pymysql
 
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
 
-from pynab.db import db_session, Group, Category, User, TvShow, Movie
+from pynab.db import db_session, Group, Category, User, TvShow, Movie, hash_api_key
 
 def convert_groups(mysql):
     """Converts Newznab groups table into Pynab. Only really
@@ -94,7 +94,7 @@ def convert_users(mysql):
         for r in cursor.fetchall():
             u = User(
                 email=r[1],
-                api_key=r[3],
+                api_key_hash=hash_api_key(r[3]),
                 grabs=r[5]
             )
             db.add(u)
@@ -72,6 +72,7 @@ if __name__ == '__main__':
         print('Copying users...')
         for user in mongo.users.find():
             user.pop('_id')
+            user['api_key_hash'] = pynab.db.hash_api_key(user.pop('api_key'))
 
             u = pynab.db.User(**user)
             postgre.add(u)
@@ -16,12 +16,13 @@ import sys
 import uuid
 
 from docopt import docopt
+from sqlalchemy.orm import defaultload
 
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
 
 import pynab
 
-from pynab.db import db_session, Release
+from pynab.db import db_session, Release, windowed_query
 
 def create_path(base_path, fileid):
     path = '/'.join([base_path, fileid[:1]])
@@ -34,7 +35,8 @@ def export_nzbs(base_path):
         print("Exporting nzb files for {} releases, this may take awhile.".format(total_releases))
         count = 0
         error = 0
-        for release in db.query(Release).all():
+        query = db.query(Release).options(defaultload('nzb').undefer('data'))
+        for release in windowed_query(query, Release.id, 1000, stream=True):
             fileid = str(uuid.uuid4()).replace('-', '')+str(release.nzb_id)+".gz"
             path = create_path(base_path, fileid)
             filepath = '/'.join([path, fileid])
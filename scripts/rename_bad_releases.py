@@ -2,6 +2,8 @@ import argparse
 import os
 import sys
 
+from sqlalchemy.orm import defaultload
+
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
 
 import pynab.releases
@@ -19,7 +21,10 @@ def rename_bad_releases(category):
         # noinspection PyComparisonWithNone,PyComparisonWithNone,PyComparisonWithNone,PyComparisonWithNone
         query = db.query(Release).filter(Release.category_id==int(category)).filter(
             (Release.files.any())|(Release.nfo_id!=None)|(Release.sfv_id!=None)|(Release.pre_id!=None)
-        ).filter((Release.status!=1)|(Release.status==None)).filter(Release.unwanted==False)
+        ).filter((Release.status!=1)|(Release.status==None)).filter(Release.unwanted==False).options(
+            defaultload('nfo').undefer('data'),
+            defaultload('sfv').undefer('data')
+        )
         for release in windowed_query(query, Release.id, config.scan.get('binary_process_chunk_size', 1000)):
             count += 1
             name, category_id = pynab.releases.discover_name(release)
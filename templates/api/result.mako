@@ -1,6 +1,6 @@
 <?xml version="1.0" encoding="UTF-8" ?>\
 <%!
-    import config, sys
+    import calendar, config, sys
     from email import utils
 %>
 <rss version="2.0" xmlns:newznab="http://www.newznab.com/DTD/2010/feeds/attributes/">
@@ -11,11 +11,11 @@
     <newznab:response offset="${offset}" total="${total}"/>
     % for release in releases:
         <%
+            # added is stored as naive utc
+            added_date = calendar.timegm(release.added.utctimetuple())
             if sys.version_info >= (3,3):
-                added_date = release.added.timestamp()
                 posted_date = release.posted.timestamp()
             else:
-                added_date = int(release.added.strftime("%s"))
                 posted_date = int(release.posted.strftime("%s"))
         %>
         <item>